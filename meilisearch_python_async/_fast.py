@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import List, Optional
+
+import msgspec
+
+
+class IndexInfoStruct(msgspec.Struct, rename="camel"):  # type: ignore[call-arg]
+    """Tightly packed equivalent of IndexInfo used for the opt-in fast decode path.
+
+    msgspec fuses JSON decoding and validation in C, skipping the intermediate dict a pydantic
+    model requires, so decoding large index listings is several times faster.
+    """
+
+    uid: str
+    primary_key: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+
+class _RawIndexesPage(msgspec.Struct):
+    results: List[IndexInfoStruct]
+
+
+_RAW_INDEXES_DECODER = msgspec.json.Decoder(_RawIndexesPage)
+
+
+def decode_raw_indexes(content: bytes) -> List[IndexInfoStruct]:
+    return _RAW_INDEXES_DECODER.decode(content).results
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Callable
 
+import orjson
 from httpx import (
     AsyncClient,
     ConnectError,
@@ -17,6 +18,9 @@ from meilisearch_python_async.errors import (
     MeiliSearchError,
 )
 
+_JSON_CONTENT_TYPE = "application/json"
+_JSON_HEADERS = {"Content-Type": _JSON_CONTENT_TYPE}
+
 
 class HttpRequests:
     def __init__(self, http_client: AsyncClient) -> None:
@@ -27,21 +31,25 @@ class HttpRequests:
         http_method: Callable,
         path: str,
         body: Any | None = None,
-        content_type: str = "applicaiton/json",
+        content_type: str = _JSON_CONTENT_TYPE,
+        allow_statuses: tuple[int, ...] = (),
     ) -> Response:
         try:
             if not body:
                 response = await http_method(path)
-            elif content_type != "application/json":
+            elif content_type != _JSON_CONTENT_TYPE:
                 response = await http_method(
                     path, content=body, headers={"Content-Type": content_type}
                 )
             else:
+                # orjson serializes to bytes in C, skipping the stdlib json encoder httpx
+                # would use for json=body
                 response = await http_method(
-                    path, json=body, headers={"Content-Type": content_type}
+                    path, content=orjson.dumps(body), headers=_JSON_HEADERS
                 )
 
-            response.raise_for_status()
+            if response.status_code not in allow_statuses:
+                response.raise_for_status()
             return response
 
         except (ConnectError, ConnectTimeout, RemoteProtocolError) as err:
@@ -53,8 +61,8 @@ class HttpRequests:
                 # Fail safe just in case error happens before response is created
                 raise MeiliSearchError(str(err))  # pragma: no cover
 
-    async def get(self, path: str) -> Response:
-        return await self._send_request(self.http_client.get, path)
+    async def get(self, path: str, *, allow_statuses: tuple[int, ...] = ()) -> Response:
+        return await self._send_request(self.http_client.get, path, allow_statuses=allow_statuses)
 
     async def patch(
         self, path: str, body: Any | None = None, content_type: str = "application/json"
@@ -1,15 +1,42 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import warnings
 from datetime import datetime
+from operator import itemgetter
+from time import monotonic
 from types import TracebackType
-from typing import Any, Type
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Sequence, Type
 
+import ijson
 import jwt
-from httpx import AsyncClient
+import orjson
+from httpx import (
+    AsyncClient,
+    AsyncHTTPTransport,
+    ConnectError,
+    ConnectTimeout,
+    HTTPError,
+    Limits,
+    RemoteProtocolError,
+)
+
+try:
+    from meilisearch_python_async._fast import IndexInfoStruct
+    from meilisearch_python_async._fast import decode_raw_indexes as _decode_raw_indexes
+
+    decode_raw_indexes: Callable[[bytes], list[IndexInfoStruct]] | None = _decode_raw_indexes
+except ImportError:  # pragma: no cover
+    decode_raw_indexes = None
 
 from meilisearch_python_async._http_requests import HttpRequests
-from meilisearch_python_async.errors import InvalidRestriction, MeiliSearchApiError
+from meilisearch_python_async.errors import (
+    InvalidRestriction,
+    MeiliSearchApiError,
+    MeiliSearchCommunicationError,
+    MeiliSearchError,
+)
 from meilisearch_python_async.index import Index
 from meilisearch_python_async.models.client import ClientStats, Key, KeyCreate, KeySearch, KeyUpdate
 from meilisearch_python_async.models.health import Health
@@ -18,11 +45,86 @@ from meilisearch_python_async.models.task import TaskInfo
 from meilisearch_python_async.models.version import Version
 from meilisearch_python_async.task import wait_for_task
 
+_VERSION_CACHE_TTL_IN_S = 3600
+_KEYS_CACHE_TTL_IN_S = 300
+_RAW_INDEX_CACHE_TTL_IN_S = 5
+
+_CLIENT_REGISTRY: dict[tuple[str, str | None, int | None], "Client"] = {}
+
+# Matches the positional argument order of Index.__init__ after http_client.
+_INDEX_FIELDS = itemgetter("uid", "primaryKey", "createdAt", "updatedAt")
+
+# Hoisted so hot paths build URLs with plain concatenation instead of runtime f-string
+# formatting.
+_INDEXES_PATH = "indexes/"
+_KEYS_PATH = "keys/"
+
+# The event loop only holds weak references to tasks, so the close tasks scheduled from
+# __del__ are kept here until they finish to stop them being garbage collected first.
+_PENDING_CLOSE_TASKS: "set[asyncio.Task]" = set()
+
+
+class _AsyncByteReader:
+    """Adapts an async byte iterator to the async file protocol ijson expects."""
+
+    def __init__(self, byte_iterator: AsyncIterator[bytes]) -> None:
+        self._byte_iterator = byte_iterator
+
+    async def read(self, n: int) -> bytes:
+        if n == 0:
+            # ijson probes with a zero-byte read to detect the reader type. Returning the next
+            # chunk here would drop it.
+            return b""
+
+        try:
+            return await self._byte_iterator.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+class _TTLCache:
+    """In-process cache for values that rarely change on the server."""
+
+    def __init__(self) -> None:
+        self._cache: dict[str, tuple[Any, float]] = {}
+
+    def get(self, key: str) -> Any | None:
+        cached = self._cache.get(key)
+        if not cached:
+            return None
+
+        value, expires_at = cached
+        if monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+
+        return value
+
+    def set(self, key: str, value: Any, ttl_in_s: float) -> None:
+        self._cache[key] = (value, monotonic() + ttl_in_s)
+
+    def delete(self, key: str) -> None:
+        self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
 
 class Client:
     """The client to connect to the MeiliSearchApi."""
 
-    def __init__(self, url: str, api_key: str | None = None, *, timeout: int | None = None) -> None:
+    def __init__(
+        self,
+        url: str,
+        api_key: str | None = None,
+        *,
+        timeout: int | None = None,
+        http2: bool = True,
+        limits: Limits | None = None,
+        retries: int = 2,
+        health_ttl: float = 0.0,
+        warm: bool = True,
+    ) -> None:
         """Class initializer.
 
         **Args:**
@@ -31,16 +133,102 @@ class Client:
         * **api_key:** The optional API key for MeiliSearch. Defaults to None.
         * **timeout:** The amount of time in seconds that the client will wait for a response before
             timing out. Defaults to None.
+        * **http2:** If set to True requests will be multiplexed over a single connection with
+            HTTP/2 when the server supports it, saving the overhead of opening a new connection
+            for each request. Defaults to True.
+        * **limits:** The connection pool limits to use for the client. If no value is provided
+            the pool will keep up to 20 connections alive for 30 seconds with a maximum of 100
+            connections.
+        * **retries:** The number of times to retry establishing a connection when a transient
+            error, i.e. a DNS failure or connection reset, occurs. Retries only happen at connect
+            time so requests are never double-submitted. Defaults to 2.
+        * **health_ttl:** The amount of time in seconds for which a successful `health` result
+            is reused without making another request. Useful when readiness probes poll in a
+            tight interval. The default of 0.0 disables the reuse so every call checks the
+            server.
+        * **warm:** If set to True, entering the async context manager pings the health endpoint
+            so the TCP and TLS handshake happens up front instead of adding latency to the first
+            real request. Defaults to True.
         """
         if api_key:
             headers = {"Authorization": f"Bearer {api_key}"}
         else:
             headers = None
 
-        self.http_client = AsyncClient(base_url=url, timeout=timeout, headers=headers)
+        if not limits:
+            limits = Limits(
+                max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+            )
+
+        # http2 and limits are configured on the transport because httpx ignores the client-level
+        # arguments when an explicit transport is provided.
+        transport = AsyncHTTPTransport(http2=http2, limits=limits, retries=retries)
+        self.http_client = AsyncClient(
+            base_url=url,
+            timeout=timeout,
+            headers=headers,
+            transport=transport,
+            follow_redirects=False,
+        )
+        self._cache = _TTLCache()
+        self._health_ttl = health_ttl
+        self._warm = warm
         self._http_requests = HttpRequests(self.http_client)
 
+    @classmethod
+    def shared(
+        cls,
+        url: str,
+        api_key: str | None = None,
+        *,
+        timeout: int | None = None,
+        http2: bool = True,
+        limits: Limits | None = None,
+        retries: int = 2,
+    ) -> Client:
+        """Gets a process-wide shared client for the provided connection settings.
+
+        Repeated calls with the same url, api_key, and timeout return the same instance so the
+        underlying connection pool, and its TCP/TLS keep-alive, is reused. This is useful in
+        frameworks that would otherwise construct a new Client in every request handler. Note
+        that because the instance is shared, calling `aclose` on it closes the client for all
+        holders.
+
+        **Args:**
+
+        * **url:** The url to the MeiliSearch API (ex: http://localhost:7700)
+        * **api_key:** The optional API key for MeiliSearch. Defaults to None.
+        * **timeout:** The amount of time in seconds that the client will wait for a response before
+            timing out. Defaults to None.
+        * **http2:** If set to True requests will be multiplexed over a single connection with
+            HTTP/2 when the server supports it. Only used when creating a new instance.
+            Defaults to True.
+        * **limits:** The connection pool limits to use for the client. Only used when creating a
+            new instance. Defaults to None.
+        * **retries:** The number of times to retry establishing a connection when a transient
+            error occurs. Only used when creating a new instance. Defaults to 2.
+
+        **Returns:** A Client instance shared by all callers using the same connection settings.
+
+        Usage:
+
+        ```py
+        >>> from meilisearch_async_client import Client
+        >>> client = Client.shared("http://localhost.com", "masterKey")
+        ```
+        """
+        registry_key = (url, api_key, timeout)
+        client = _CLIENT_REGISTRY.get(registry_key)
+
+        if not client or client.http_client.is_closed:
+            client = cls(url, api_key, timeout=timeout, http2=http2, limits=limits, retries=retries)
+            _CLIENT_REGISTRY[registry_key] = client
+
+        return client
+
     async def __aenter__(self) -> Client:
+        if self._warm:
+            await self.health()
         return self
 
     async def __aexit__(
@@ -58,6 +246,46 @@ class Client:
         """
         await self.http_client.aclose()
 
+    def __del__(self) -> None:
+        # Best-effort safety net so a forgotten aclose doesn't leak the connection pool. The
+        # getattr guards against __init__ failing before http_client was set.
+        http_client = getattr(self, "http_client", None)
+        if not http_client or http_client.is_closed:
+            return
+
+        warnings.warn(
+            "Client was not closed. Use the client as an async context manager, or call aclose, to release the connection pool",
+            ResourceWarning,
+            stacklevel=2,
+        )
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        task = loop.create_task(http_client.aclose())
+        _PENDING_CLOSE_TASKS.add(task)
+        task.add_done_callback(_PENDING_CLOSE_TASKS.discard)
+
+    def invalidate_cache(self) -> None:
+        """Clears any cached server information.
+
+        Results from `get_version`, `get_keys`, and the raw index methods when called with
+        `cache=True` are cached in-process. Use this method to force the next call to retrieve
+        fresh information from the server, i.e. after keys have been rotated outside of this
+        client.
+
+        Usage:
+
+        ```py
+        >>> from meilisearch_async_client import Client
+        >>> async with Client("http://localhost.com", "masterKey") as client:
+        >>>     client.invalidate_cache()
+        ```
+        """
+        self._cache.clear()
+
     async def create_dump(self) -> TaskInfo:
         """Trigger the creation of a MeiliSearch dump.
 
@@ -77,7 +305,7 @@ class Client:
         ```
         """
         response = await self._http_requests.post("dumps")
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def create_index(self, uid: str, primary_key: str | None = None) -> Index:
         """Creates a new index.
@@ -102,14 +330,22 @@ class Client:
         >>>     index = await client.create_index("movies")
         ```
         """
-        return await Index.create(self.http_client, uid, primary_key)
+        index = await Index.create(self.http_client, uid, primary_key)
+        known = self._cache.get("known-indexes")
+        if known is not None:
+            known.add(uid)
+        return index
 
-    async def delete_index_if_exists(self, uid: str) -> bool:
+    async def delete_index_if_exists(self, uid: str, *, cache: bool = False) -> bool:
         """Deletes an index if it already exists.
 
         **Args:**
 
         * **uid:** The index's unique identifier.
+        * **cache:** If set to True and a recent `get_indexes` call showed the index does not
+            exist the delete request is skipped entirely. Indexes created by another client
+            within the last few seconds may be missed by this shortcut, so only use it when
+            this client is the only writer. Defaults to False.
 
         **Returns:** True if an index was deleted for False if not.
 
@@ -126,13 +362,50 @@ class Client:
         >>>     await client.delete_index_if_exists()
         ```
         """
-        url = f"indexes/{uid}"
+        known = self._cache.get("known-indexes")
+        if cache and known is not None and uid not in known:
+            return False
+
+        url = _INDEXES_PATH + uid
         response = await self._http_requests.delete(url)
-        status = await wait_for_task(self.http_client, response.json()["taskUid"])
+        status = await wait_for_task(self.http_client, orjson.loads(response.content)["taskUid"])
+        if known is not None:
+            known.discard(uid)
         if status.status == "succeeded":
             return True
         return False
 
+    async def delete_indexes_if_exist(
+        self, uids: Sequence[str], *, max_concurrency: int = 10
+    ) -> dict[str, bool]:
+        """Deletes multiple indexes if they exist, issuing the deletes concurrently.
+
+        **Args:**
+
+        * **uids:** The unique identifiers of the indexes to delete.
+        * **max_concurrency:** The maximum number of deletes allowed to run at the same time.
+            Defaults to 10.
+
+        **Returns:** A dict mapping each uid to True if an index was deleted or False if not.
+
+        **Raises:**
+
+        * **MeilisearchCommunicationError:** If there was an error communicating with the server.
+        * **MeilisearchApiError:** If the MeiliSearch API returned an error.
+
+        Usage:
+
+        ```py
+        >>> from meilisearch_async_client import Client
+        >>> async with Client("http://localhost.com", "masterKey") as client:
+        >>>     deleted = await client.delete_indexes_if_exist(["movies", "books"])
+        ```
+        """
+        results = await self.gather(
+            *(self.delete_index_if_exists(x) for x in uids), max_concurrency=max_concurrency
+        )
+        return dict(zip(uids, results))
+
     def generate_tenant_token(
         self,
         search_rules: dict[str, Any] | list[str],
@@ -193,6 +466,41 @@ class Client:
 
         return jwt.encode(payload, api_key.key, algorithm="HS256")
 
+    async def gather(self, *aws: Awaitable[Any], max_concurrency: int = 10) -> list[Any]:
+        """Run multiple operations concurrently with bounded concurrency.
+
+        Because the awaitables share the client's connection pool, overlapping them hides the
+        network latency of each individual request.
+
+        **Args:**
+
+        * **aws:** The awaitables to run.
+        * **max_concurrency:** The maximum number of awaitables allowed to run at the same time.
+            Defaults to 10.
+
+        **Returns:** A list with the results of the awaitables, in the order they were passed.
+
+        **Raises:**
+
+        * **MeilisearchCommunicationError:** If there was an error communicating with the server.
+        * **MeilisearchApiError:** If the MeiliSearch API returned an error.
+
+        Usage:
+
+        ```py
+        >>> from meilisearch_async_client import Client
+        >>> async with Client("http://localhost.com", "masterKey") as client:
+        >>>     stats, health = await client.gather(client.get_all_stats(), client.health())
+        ```
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run(aw: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(*(_run(x) for x in aws))
+
     async def get_indexes(self) -> list[Index] | None:
         """Get all indexes.
 
@@ -210,28 +518,68 @@ class Client:
         >>>     indexes = await client.get_indexes()
         ```
         """
-        response = await self._http_requests.get("indexes")
+        indexes = [index async for index in self.get_indexes_stream()]
+        self._cache.set(
+            "known-indexes", {index.uid for index in indexes}, _RAW_INDEX_CACHE_TTL_IN_S
+        )
 
-        if not response.json()["results"]:
+        if not indexes:
             return None
 
-        return [
-            Index(
-                http_client=self.http_client,
-                uid=x["uid"],
-                primary_key=x["primaryKey"],
-                created_at=x["createdAt"],
-                updated_at=x["updatedAt"],
-            )
-            for x in response.json()["results"]
-        ]
+        return indexes
+
+    async def get_indexes_stream(self) -> AsyncGenerator[Index, None]:
+        """Get all indexes, yielding each index as it is parsed from the response.
+
+        Index instances are constructed while the response bytes arrive rather than after the
+        full payload has been read and parsed, keeping memory use flat regardless of how many
+        indexes the server returns.
+
+        **Returns:** An async generator of all indexes.
+
+        **Raises:**
+        * **MeilisearchCommunicationError:** If there was an error communicating with the server.
+        * **MeilisearchApiError:** If the MeiliSearch API returned an error.
 
-    async def get_index(self, uid: str) -> Index:
+        Usage:
+
+        ```py
+        >>> from meilisearch_async_client import Client
+        >>> async with Client("http://localhost.com", "masterKey") as client:
+        >>>     async for index in client.get_indexes_stream():
+        >>>         print(index.uid)
+        ```
+        """
+        try:
+            async with self.http_client.stream("GET", "indexes") as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    response.raise_for_status()
+
+                reader = _AsyncByteReader(response.aiter_bytes())
+                async for x in ijson.items(reader, "results.item"):
+                    yield Index(self.http_client, *_INDEX_FIELDS(x))
+        except (ConnectError, ConnectTimeout, RemoteProtocolError) as err:
+            raise MeiliSearchCommunicationError(str(err)) from err
+        except HTTPError as err:
+            if "response" in locals():
+                raise MeiliSearchApiError(str(err), response) from err
+            else:
+                # Fail safe just in case error happens before response is created
+                raise MeiliSearchError(str(err))  # pragma: no cover
+
+    async def get_index(self, uid: str, *, fetch: bool = True) -> Index:
         """Gets a single index based on the uid of the index.
 
+        If the index is only needed to issue further operations, i.e. search or adding documents,
+        the primary key and timestamp information retrieved from the server is unused. In this
+        case `fetch=False`, or the `index` method, will skip the network call entirely.
+
         **Args:**
 
         * **uid:** The index's unique identifier.
+        * **fetch:** If set to False the information for the index will not be retrieved from the
+            server, saving a network call. Defaults to True.
 
         **Returns:** An Index instance containing the information of the fetched index.
 
@@ -248,7 +596,40 @@ class Client:
         >>>     index = await client.get_index()
         ```
         """
-        return await Index(self.http_client, uid).fetch_info()
+        index = Index(self.http_client, uid)
+
+        if not fetch:
+            return index
+
+        return await index.fetch_info()
+
+    async def get_indexes_by_uids(self, uids: Sequence[str]) -> list[Index]:
+        """Gets multiple indexes by their uids, fetching the information concurrently.
+
+        Because the requests run concurrently through `gather`, retrieving N indexes costs
+        roughly one round trip rather than N sequential ones, and no bandwidth is wasted
+        retrieving indexes that aren't needed.
+
+        **Args:**
+
+        * **uids:** The unique identifiers of the indexes to retrieve.
+
+        **Returns:** A list of Index instances in the same order as the provided uids.
+
+        **Raises:**
+
+        * **MeilisearchCommunicationError:** If there was an error communicating with the server.
+        * **MeilisearchApiError:** If the MeiliSearch API returned an error.
+
+        Usage:
+
+        ```py
+        >>> from meilisearch_async_client import Client
+        >>> async with Client("http://localhost.com", "masterKey") as client:
+        >>>     indexes = await client.get_indexes_by_uids(["movies", "books"])
+        ```
+        """
+        return await self.gather(*(self.get_index(x) for x in uids))
 
     def index(self, uid: str) -> Index:
         """Create a local reference to an index identified by UID, without making an HTTP call.
@@ -296,7 +677,7 @@ class Client:
         ```
         """
         response = await self._http_requests.get("stats")
-        return ClientStats(**response.json())
+        return ClientStats(**orjson.loads(response.content))
 
     async def get_or_create_index(self, uid: str, primary_key: str | None = None) -> Index:
         """Get an index, or create it if it doesn't exist.
@@ -362,7 +743,8 @@ class Client:
         # The json.loads(key.json()) is because Pydantic can't serialize a date in a Python dict,
         # but can when converting to a json string.
         response = await self._http_requests.post("keys", json.loads(key.json(by_alias=True)))
-        return Key(**response.json())
+        self._cache.delete("keys")
+        return Key(**orjson.loads(response.content))
 
     async def delete_key(self, key: str) -> int:
         """Deletes an API key.
@@ -386,12 +768,17 @@ class Client:
         >>>     await client.delete_key("abc123")
         ```
         """
-        response = await self._http_requests.delete(f"keys/{key}")
+        response = await self._http_requests.delete(_KEYS_PATH + key)
+        self._cache.delete("keys")
         return response.status_code
 
     async def get_keys(self) -> KeySearch:
         """Gets the MeiliSearch API keys.
 
+        The result is cached for a few minutes since keys only change on explicit rotation. Key
+        changes made through this client invalidate the cache automatically, and
+        `invalidate_cache` can be used to pick up changes made elsewhere.
+
         **Returns:** API keys.
 
         **Raises:**
@@ -407,8 +794,15 @@ class Client:
         >>>     keys = await client.get_keys()
         ```
         """
+        cached = self._cache.get("keys")
+        if cached:
+            return cached
+
         response = await self._http_requests.get("keys")
-        return KeySearch(**response.json())
+        keys = KeySearch(**orjson.loads(response.content))
+        self._cache.set("keys", keys, _KEYS_CACHE_TTL_IN_S)
+
+        return keys
 
     async def get_key(self, key: str) -> Key:
         """Gets information about a specific API key.
@@ -432,8 +826,8 @@ class Client:
         >>>     keys = await client.get_key("abc123")
         ```
         """
-        response = await self._http_requests.get(f"keys/{key}")
-        return Key(**response.json())
+        response = await self._http_requests.get(_KEYS_PATH + key)
+        return Key(**orjson.loads(response.content))
 
     async def update_key(self, key: KeyUpdate) -> Key:
         """Update an API key.
@@ -466,15 +860,18 @@ class Client:
         # The json.loads(key.json()) is because Pydantic can't serialize a date in a Python dict,
         # but can when converting to a json string.
         payload = {k: v for k, v in json.loads(key.json(by_alias=True)).items() if v is not None}
-        response = await self._http_requests.patch(f"keys/{key.key}", payload)
-        return Key(**response.json())
+        response = await self._http_requests.patch(_KEYS_PATH + key.key, payload)
+        self._cache.delete("keys")
+        return Key(**orjson.loads(response.content))
 
-    async def get_raw_index(self, uid: str) -> IndexInfo | None:
+    async def get_raw_index(self, uid: str, *, cache: bool = False) -> IndexInfo | None:
         """Gets the index and returns all the index information rather than an Index instance.
 
         **Args:**
 
         * **uid:** The index's unique identifier.
+        * **cache:** If set to True the retrieved information will be cached for a few seconds so
+            repeated calls don't each make a network request. Defaults to False.
 
         **Returns:** Index information rather than an Index instance.
 
@@ -491,22 +888,44 @@ class Client:
         >>>     index = await client.get_raw_index("movies")
         ```
         """
-        response = await self.http_client.get(f"indexes/{uid}")
+        cache_key = f"raw-index-{uid}"
+        if cache:
+            cached = self._cache.get(cache_key)
+            if cached:
+                return cached
+
+        response = await self._http_requests.get(_INDEXES_PATH + uid, allow_statuses=(404,))
 
         if response.status_code == 404:
             return None
 
-        return IndexInfo(**response.json())
+        info = IndexInfo(**orjson.loads(response.content))
+        if cache:
+            self._cache.set(cache_key, info, _RAW_INDEX_CACHE_TTL_IN_S)
+
+        return info
 
-    async def get_raw_indexes(self) -> list[IndexInfo] | None:
+    async def get_raw_indexes(
+        self, *, cache: bool = False, fast: bool = False
+    ) -> list[IndexInfo] | list[IndexInfoStruct] | None:
         """Gets all the indexes.
 
         Returns all the index information rather than an Index instance.
 
+        **Args:**
+
+        * **cache:** If set to True the retrieved information will be cached for a few seconds so
+            repeated calls don't each make a network request. Defaults to False.
+        * **fast:** If set to True the response is decoded into msgspec structs instead of
+            pydantic models, which is several times faster for large listings. The structs carry
+            the same fields as IndexInfo. Requires installing with the `fast` extra. Defaults to
+            False.
+
         **Returns:** A list of the Index information rather than an Index instances.
 
         **Raises:**
 
+        * **MeiliSearchError:** If `fast` is requested and msgspec is not installed.
         * **MeilisearchCommunicationError:** If there was an error communicating with the server.
         * **MeilisearchApiError:** If the MeiliSearch API returned an error.
 
@@ -518,16 +937,39 @@ class Client:
         >>>     index = await client.get_raw_indexes()
         ```
         """
+        if fast and decode_raw_indexes is None:
+            raise MeiliSearchError(
+                "The fast option requires msgspec. Install it with the fast extra: pip install meilisearch-python-async[fast]"
+            )
+
+        cache_key = "raw-indexes-fast" if fast else "raw-indexes"
+        if cache:
+            cached = self._cache.get(cache_key)
+            if cached:
+                return cached
+
         response = await self._http_requests.get("indexes")
 
-        if not response.json()["results"]:
+        info: list[IndexInfo] | list[IndexInfoStruct]
+        if fast and decode_raw_indexes is not None:
+            info = decode_raw_indexes(response.content)
+        else:
+            info = [IndexInfo(**x) for x in orjson.loads(response.content)["results"]]
+
+        if not info:
             return None
 
-        return [IndexInfo(**x) for x in response.json()["results"]]
+        if cache:
+            self._cache.set(cache_key, info, _RAW_INDEX_CACHE_TTL_IN_S)
+
+        return info
 
     async def get_version(self) -> Version:
         """Get the MeiliSearch version.
 
+        Because the server version can't change while it is running, the result is cached after
+        the first call. `invalidate_cache` can be used to force a fresh retrieval.
+
         **Returns:** Information about the version of MeiliSearch.
 
         **Raises:**
@@ -543,13 +985,22 @@ class Client:
         >>>     version = await client.get_version()
         ```
         """
+        cached = self._cache.get("version")
+        if cached:
+            return cached
+
         response = await self._http_requests.get("version")
+        version = Version(**orjson.loads(response.content))
+        self._cache.set("version", version, _VERSION_CACHE_TTL_IN_S)
 
-        return Version(**response.json())
+        return version
 
     async def health(self) -> Health:
         """Get health of the MeiliSearch server.
 
+        If the client was created with a `health_ttl`, a successful result is reused for that
+        many seconds before another request is made.
+
         **Returns:** The status of the MeiliSearch server.
 
         **Raises:**
@@ -565,5 +1016,15 @@ class Client:
         >>>     health = await client.get_healths()
         ```
         """
+        if self._health_ttl:
+            cached = self._cache.get("health")
+            if cached:
+                return cached
+
         response = await self._http_requests.get("health")
-        return Health(**response.json())
+        health = Health(**orjson.loads(response.content))
+
+        if self._health_ttl:
+            self._cache.set("health", health, self._health_ttl)
+
+        return health
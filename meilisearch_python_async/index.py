@@ -4,12 +4,14 @@ import json
 from asyncio import gather, get_running_loop
 from csv import DictReader
 from datetime import datetime
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any, AsyncGenerator
 from urllib.parse import urlencode
 
 import aiofiles
+import ciso8601
+import orjson
 from httpx import AsyncClient
 
 from meilisearch_python_async._http_requests import HttpRequests
@@ -22,6 +24,18 @@ from meilisearch_python_async.models.task import TaskInfo
 from meilisearch_python_async.task import wait_for_task
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_cached(iso_date: str) -> datetime:
+    """Parse an ISO 8601 string from MeiliSearch into a datetime.
+
+    ciso8601 does the parse in C, truncating MeiliSearch's nanosecond precision to
+    microseconds, and the same created_at/updated_at strings come back on every index refresh
+    so the parsed values are also memoized to skip the parse on repeat calls. The time zone is
+    dropped to keep the previous naive datetime behavior.
+    """
+    return ciso8601.parse_datetime(iso_date).replace(tzinfo=None)
+
+
 class Index:
     """Index class gives access to all indexes routes and child routes.
 
@@ -88,7 +102,7 @@ class Index:
         """
         url = f"{self._base_url_with_uid}"
         response = await self._http_requests.delete(url)
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def delete_if_exists(self) -> bool:
         """Delete the index if it already exists.
@@ -142,9 +156,11 @@ class Index:
         payload = {"primaryKey": primary_key}
         url = f"{self._base_url_with_uid}"
         response = await self._http_requests.patch(url, payload)
-        await wait_for_task(self.http_client, response.json()["taskUid"], timeout_in_ms=100000)
+        await wait_for_task(
+            self.http_client, orjson.loads(response.content)["taskUid"], timeout_in_ms=100000
+        )
         index_response = await self._http_requests.get(f"{url}")
-        self.primary_key = index_response.json()["primaryKey"]
+        self.primary_key = orjson.loads(index_response.content)["primaryKey"]
         return self
 
     async def fetch_info(self) -> Index:
@@ -168,7 +184,7 @@ class Index:
         """
         url = f"{self._base_url_with_uid}"
         response = await self._http_requests.get(url)
-        index_dict = response.json()
+        index_dict = orjson.loads(response.content)
         self.primary_key = index_dict["primaryKey"]
         loop = get_running_loop()
         self.created_at = await loop.run_in_executor(
@@ -240,9 +256,11 @@ class Index:
         url = "indexes"
         http_request = HttpRequests(http_client)
         response = await http_request.post(url, payload)
-        await wait_for_task(http_client, response.json()["taskUid"], timeout_in_ms=100000)
+        await wait_for_task(
+            http_client, orjson.loads(response.content)["taskUid"], timeout_in_ms=100000
+        )
         index_response = await http_request.get(f"{url}/{uid}")
-        index_dict = index_response.json()
+        index_dict = orjson.loads(index_response.content)
         return cls(
             http_client=http_client,
             uid=index_dict["uid"],
@@ -273,7 +291,7 @@ class Index:
         url = f"{self._stats_url}"
         response = await self._http_requests.get(url)
 
-        return IndexStats(**response.json())
+        return IndexStats(**orjson.loads(response.content))
 
     async def search(
         self,
@@ -351,7 +369,7 @@ class Index:
         url = f"{self._base_url_with_uid}/search"
         response = await self._http_requests.post(url, body=body)
 
-        return SearchResults(**response.json())
+        return SearchResults(**orjson.loads(response.content))
 
     async def get_document(self, document_id: str) -> dict[str, Any]:
         """Get one document with given document identifier.
@@ -378,7 +396,7 @@ class Index:
         """
         url = f"{self._documents_url}/{document_id}"
         response = await self._http_requests.get(url)
-        return response.json()
+        return orjson.loads(response.content)
 
     async def get_documents(
         self, *, offset: int = 0, limit: int = 20, fields: list[str] | None = None
@@ -420,7 +438,7 @@ class Index:
         url = f"{self._documents_url}?{urlencode(parameters)}"
         response = await self._http_requests.get(url)
 
-        return DocumentsInfo(**response.json())
+        return DocumentsInfo(**orjson.loads(response.content))
 
     async def add_documents(
         self, documents: list[dict], primary_key: str | None = None
@@ -459,7 +477,7 @@ class Index:
             url = f"{url}?{formatted_primary_key}"
 
         response = await self._http_requests.post(url, documents)
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def add_documents_in_batches(
         self, documents: list[dict], *, batch_size: int = 1000, primary_key: str | None = None
@@ -797,7 +815,7 @@ class Index:
 
         response = await self._http_requests.post(url, body=data, content_type=content_type)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def update_documents(
         self, documents: list[dict], primary_key: str | None = None
@@ -836,7 +854,7 @@ class Index:
             url = f"{url}?{formatted_primary_key}"
 
         response = await self._http_requests.put(url, documents)
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def update_documents_in_batches(
         self, documents: list[dict], *, batch_size: int = 1000, primary_key: str | None = None
@@ -1172,7 +1190,7 @@ class Index:
 
         response = await self._http_requests.put(url, body=data, content_type=content_type)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def delete_document(self, document_id: str) -> TaskInfo:
         """Delete one document from the index.
@@ -1200,7 +1218,7 @@ class Index:
         url = f"{self._documents_url}/{document_id}"
         response = await self._http_requests.delete(url)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def delete_documents(self, ids: list[str]) -> TaskInfo:
         """Delete multiple documents from the index.
@@ -1228,7 +1246,7 @@ class Index:
         url = f"{self._documents_url}/delete-batch"
         response = await self._http_requests.post(url, ids)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def delete_all_documents(self) -> TaskInfo:
         """Delete all documents from the index.
@@ -1252,7 +1270,7 @@ class Index:
         url = f"{self._documents_url}"
         response = await self._http_requests.delete(url)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def get_settings(self) -> MeiliSearchSettings:
         """Get settings of the index.
@@ -1276,7 +1294,7 @@ class Index:
         url = f"{self._settings_url}"
         response = await self._http_requests.get(url)
 
-        return MeiliSearchSettings(**response.json())
+        return MeiliSearchSettings(**orjson.loads(response.content))
 
     async def update_settings(self, body: MeiliSearchSettings) -> TaskInfo:
         """Update settings of the index.
@@ -1326,7 +1344,7 @@ class Index:
         url = f"{self._settings_url}"
         response = await self._http_requests.patch(url, body_dict)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def reset_settings(self) -> TaskInfo:
         """Reset settings of the index to default values.
@@ -1350,7 +1368,7 @@ class Index:
         url = f"{self._settings_url}"
         response = await self._http_requests.delete(url)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def get_ranking_rules(self) -> list[str]:
         """Get ranking rules of the index.
@@ -1374,7 +1392,7 @@ class Index:
         url = f"{self._settings_url}/ranking-rules"
         response = await self._http_requests.get(url)
 
-        return response.json()
+        return orjson.loads(response.content)
 
     async def update_ranking_rules(self, ranking_rules: list[str]) -> TaskInfo:
         """Update ranking rules of the index.
@@ -1412,7 +1430,7 @@ class Index:
         url = f"{self._settings_url}/ranking-rules"
         respose = await self._http_requests.put(url, ranking_rules)
 
-        return TaskInfo(**respose.json())
+        return TaskInfo(**orjson.loads(respose.content))
 
     async def reset_ranking_rules(self) -> TaskInfo:
         """Reset ranking rules of the index to default values.
@@ -1436,7 +1454,7 @@ class Index:
         url = f"{self._settings_url}/ranking-rules"
         response = await self._http_requests.delete(url)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def get_distinct_attribute(self) -> str | None:
         """Get distinct attribute of the index.
@@ -1461,10 +1479,10 @@ class Index:
         url = f"{self._settings_url}/distinct-attribute"
         response = await self._http_requests.get(url)
 
-        if not response.json():
+        if not orjson.loads(response.content):
             None
 
-        return response.json()
+        return orjson.loads(response.content)
 
     async def update_distinct_attribute(self, body: str) -> TaskInfo:
         """Update distinct attribute of the index.
@@ -1492,7 +1510,7 @@ class Index:
         url = f"{self._settings_url}/distinct-attribute"
         response = await self._http_requests.put(url, body)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def reset_distinct_attribute(self) -> TaskInfo:
         """Reset distinct attribute of the index to default values.
@@ -1516,7 +1534,7 @@ class Index:
         url = f"{self._settings_url}/distinct-attribute"
         response = await self._http_requests.delete(url)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def get_searchable_attributes(self) -> list[str]:
         """Get searchable attributes of the index.
@@ -1539,7 +1557,7 @@ class Index:
         """
         url = f"{self._settings_url}/searchable-attributes"
         response = await self._http_requests.get(url)
-        return response.json()
+        return orjson.loads(response.content)
 
     async def update_searchable_attributes(self, body: list[str]) -> TaskInfo:
         """Update searchable attributes of the index.
@@ -1567,7 +1585,7 @@ class Index:
         url = f"{self._settings_url}/searchable-attributes"
         response = await self._http_requests.put(url, body)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def reset_searchable_attributes(self) -> TaskInfo:
         """Reset searchable attributes of the index to default values.
@@ -1595,7 +1613,7 @@ class Index:
         url = f"{self._settings_url}/searchable-attributes"
         response = await self._http_requests.delete(url)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def get_displayed_attributes(self) -> list[str]:
         """Get displayed attributes of the index.
@@ -1618,7 +1636,7 @@ class Index:
         """
         url = f"{self._settings_url}/displayed-attributes"
         response = await self._http_requests.get(url)
-        return response.json()
+        return orjson.loads(response.content)
 
     async def update_displayed_attributes(self, body: list[str]) -> TaskInfo:
         """Update displayed attributes of the index.
@@ -1648,7 +1666,7 @@ class Index:
         url = f"{self._settings_url}/displayed-attributes"
         response = await self._http_requests.put(url, body)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def reset_displayed_attributes(self) -> TaskInfo:
         """Reset displayed attributes of the index to default values.
@@ -1672,7 +1690,7 @@ class Index:
         url = f"{self._settings_url}/displayed-attributes"
         response = await self._http_requests.delete(url)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def get_stop_words(self) -> list[str] | None:
         """Get stop words of the index.
@@ -1696,10 +1714,10 @@ class Index:
         url = f"{self._settings_url}/stop-words"
         response = await self._http_requests.get(url)
 
-        if not response.json():
+        if not orjson.loads(response.content):
             return None
 
-        return response.json()
+        return orjson.loads(response.content)
 
     async def update_stop_words(self, body: list[str]) -> TaskInfo:
         """Update stop words of the index.
@@ -1727,7 +1745,7 @@ class Index:
         url = f"{self._settings_url}/stop-words"
         response = await self._http_requests.put(url, body)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def reset_stop_words(self) -> TaskInfo:
         """Reset stop words of the index to default values.
@@ -1751,7 +1769,7 @@ class Index:
         url = f"{self._settings_url}/stop-words"
         response = await self._http_requests.delete(url)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def get_synonyms(self) -> dict[str, list[str]] | None:
         """Get synonyms of the index.
@@ -1775,10 +1793,10 @@ class Index:
         url = f"{self._settings_url}/synonyms"
         response = await self._http_requests.get(url)
 
-        if not response.json():
+        if not orjson.loads(response.content):
             return None
 
-        return response.json()
+        return orjson.loads(response.content)
 
     async def update_synonyms(self, body: dict[str, list[str]]) -> TaskInfo:
         """Update synonyms of the index.
@@ -1808,7 +1826,7 @@ class Index:
         url = f"{self._settings_url}/synonyms"
         response = await self._http_requests.put(url, body)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def reset_synonyms(self) -> TaskInfo:
         """Reset synonyms of the index to default values.
@@ -1832,7 +1850,7 @@ class Index:
         url = f"{self._settings_url}/synonyms"
         response = await self._http_requests.delete(url)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def get_filterable_attributes(self) -> list[str] | None:
         """Get filterable attributes of the index.
@@ -1856,10 +1874,10 @@ class Index:
         url = f"{self._settings_url}/filterable-attributes"
         response = await self._http_requests.get(url)
 
-        if not response.json():
+        if not orjson.loads(response.content):
             return None
 
-        return response.json()
+        return orjson.loads(response.content)
 
     async def update_filterable_attributes(self, body: list[str]) -> TaskInfo:
         """Update filterable attributes of the index.
@@ -1887,7 +1905,7 @@ class Index:
         url = f"{self._settings_url}/filterable-attributes"
         response = await self._http_requests.put(url, body)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def reset_filterable_attributes(self) -> TaskInfo:
         """Reset filterable attributes of the index to default values.
@@ -1911,7 +1929,7 @@ class Index:
         url = f"{self._settings_url}/filterable-attributes"
         response = await self._http_requests.delete(url)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def get_sortable_attributes(self) -> list[str]:
         """Get sortable attributes of the Index.
@@ -1935,7 +1953,7 @@ class Index:
         url = f"{self._settings_url}/sortable-attributes"
         response = await self._http_requests.get(url)
 
-        return response.json()
+        return orjson.loads(response.content)
 
     async def update_sortable_attributes(self, sortable_attributes: list[str]) -> TaskInfo:
         """Get sortable attributes of the Index.
@@ -1959,7 +1977,7 @@ class Index:
         url = f"{self._settings_url}/sortable-attributes"
         response = await self._http_requests.put(url, sortable_attributes)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def reset_sortable_attributes(self) -> TaskInfo:
         """Reset sortable attributes of the index to default values.
@@ -1983,7 +2001,7 @@ class Index:
         url = f"{self._settings_url}/sortable-attributes"
         response = await self._http_requests.delete(url)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def get_typo_tolerance(self) -> TypoTolerance:
         """Get typo tolerance for the index.
@@ -2007,7 +2025,7 @@ class Index:
         url = f"{self._settings_url}/typo-tolerance"
         response = await self._http_requests.get(url)
 
-        return TypoTolerance(**response.json())
+        return TypoTolerance(**orjson.loads(response.content))
 
     async def update_typo_tolerance(self, typo_tolerance: TypoTolerance) -> TaskInfo:
         """Update typo tolerance.
@@ -2032,7 +2050,7 @@ class Index:
         url = f"{self._settings_url}/typo-tolerance"
         response = await self._http_requests.patch(url, typo_tolerance.dict(by_alias=True))
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     async def reset_typo_tolerance(self) -> TaskInfo:
         """Reset typo tolerance to default values.
@@ -2056,7 +2074,7 @@ class Index:
         url = f"{self._settings_url}/typo-tolerance"
         response = await self._http_requests.delete(url)
 
-        return TaskInfo(**response.json())
+        return TaskInfo(**orjson.loads(response.content))
 
     @staticmethod
     async def _batch(documents: list[dict], batch_size: int) -> AsyncGenerator[list[dict], None]:
@@ -2088,13 +2106,7 @@ class Index:
         if isinstance(iso_date, datetime):
             return iso_date
 
-        try:
-            return datetime.strptime(iso_date, "%Y-%m-%dT%H:%M:%S.%fZ")
-        except ValueError:
-            split = iso_date.split(".")
-            reduce = len(split[1]) - 6
-            reduced = f"{split[0]}.{split[1][:-reduce]}Z"
-            return datetime.strptime(reduced, "%Y-%m-%dT%H:%M:%S.%fZ")
+        return _parse_iso_cached(iso_date)
 
     @staticmethod
     async def _load_documents_from_file(
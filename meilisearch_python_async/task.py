@@ -3,6 +3,7 @@ from __future__ import annotations
 from asyncio import sleep
 from datetime import datetime
 
+import orjson
 from httpx import AsyncClient
 
 from meilisearch_python_async._http_requests import HttpRequests
@@ -39,7 +40,7 @@ async def get_tasks(http_client: AsyncClient, index_id: str | None = None) -> li
     """
     url = f"tasks?indexUid={index_id}" if index_id else "tasks"
     response = await http_client.get(url)
-    tasks = [TaskStatus(**x) for x in response.json()["results"]]
+    tasks = [TaskStatus(**x) for x in orjson.loads(response.content)["results"]]
 
     return tasks
 
@@ -72,7 +73,7 @@ async def get_task(http_client: AsyncClient, task_id: int) -> TaskStatus:
     """
     response = await http_client.get(f"tasks/{task_id}")
 
-    return TaskStatus(**response.json())
+    return TaskStatus(**orjson.loads(response.content))
 
 
 async def wait_for_task(
@@ -86,7 +87,9 @@ async def wait_for_task(
     * **task_id:** Identifier of the task to retrieve.
     * **timeout_in_ms:** Amount of time in milliseconds to wait before raising a
         MeiliSearchTimeoutError. Defaults to 5000.
-    * **interval_in_ms:** Time interval in miliseconds to sleep between requests. Defaults to 50.
+    * **interval_in_ms:** Maximum time interval in miliseconds to sleep between requests. Polling
+        starts at 5 ms and backs off exponentially up to this value so fast tasks are caught
+        early. Defaults to 50.
 
     **Returns:** Details of the processed update status.
 
@@ -115,12 +118,14 @@ async def wait_for_task(
     http_requests = HttpRequests(http_client)
     start_time = datetime.now()
     elapsed_time = 0.0
+    delay = min(0.005, interval_in_ms / 1000)
     while elapsed_time < timeout_in_ms:
         response = await http_requests.get(url)
-        status = TaskStatus(**response.json())
+        status = TaskStatus(**orjson.loads(response.content))
         if status.status in ("succeeded", "failed"):
             return status
-        await sleep(interval_in_ms / 1000)
+        await sleep(delay)
+        delay = min(delay * 1.5, interval_in_ms / 1000)
         time_delta = datetime.now() - start_time
         elapsed_time = time_delta.seconds * 1000 + time_delta.microseconds / 1000
     raise MeiliSearchTimeoutError(
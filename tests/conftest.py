@@ -2,9 +2,16 @@ import asyncio
 import csv
 import json
 from pathlib import Path
+from uuid import uuid4
 
+import orjson
 import pytest
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None  # type: ignore[assignment]
+
 from meilisearch_python_async.client import Client
 from meilisearch_python_async.task import wait_for_task
 
@@ -20,16 +27,17 @@ INDEX_FIXTURE = [
     {"uid": INDEX_UID2, "primary_key": "book_id"},
 ]
 
+READ_ONLY_INDEX_UID = f"read-only-{uuid4().hex}"
+
 ROOT_PATH = Path().absolute()
 SMALL_MOVIES_PATH = ROOT_PATH / "datasets" / "small_movies.json"
 
 
 @pytest.fixture(scope="session", autouse=True)
 def event_loop():
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    loop = asyncio.new_event_loop()
     yield loop
     loop.close()
 
@@ -46,9 +54,13 @@ async def clear_indexes(test_client):
     yield
     indexes = await test_client.get_indexes()
     if indexes:
-        for index in indexes:
-            response = await test_client.index(index.uid).delete()
-            await wait_for_task(test_client.http_client, response.task_uid)
+        indexes = [x for x in indexes if x.uid != READ_ONLY_INDEX_UID]
+        responses = await asyncio.gather(
+            *(test_client.index(index.uid).delete() for index in indexes)
+        )
+        await asyncio.gather(
+            *(wait_for_task(test_client.http_client, response.task_uid) for response in responses)
+        )
 
 
 @pytest.fixture(scope="session")
@@ -83,17 +95,15 @@ def index_uid4():
 
 @pytest.fixture
 async def indexes_sample(test_client):
-    indexes = []
-    for index_args in INDEX_FIXTURE:
-        index = await test_client.create_index(**index_args)
-        indexes.append(index)
+    indexes = await asyncio.gather(
+        *(test_client.create_index(**index_args) for index_args in INDEX_FIXTURE)
+    )
     yield indexes
 
 
 @pytest.fixture(scope="session")
 def small_movies():
-    with open(SMALL_MOVIES_PATH, "r") as movie_file:
-        yield json.loads(movie_file.read())
+    yield orjson.loads(SMALL_MOVIES_PATH.read_bytes())
 
 
 @pytest.fixture(scope="session")
@@ -124,6 +134,20 @@ def small_movies_path():
     return SMALL_MOVIES_PATH
 
 
+@pytest.fixture(scope="session")
+async def shared_empty_index(test_client):
+    """A single index shared by read-only tests.
+
+    The clear_indexes fixture leaves this index alone so it is only created once for the whole
+    session instead of once per read-only test. Tests that mutate the index should use
+    empty_index instead.
+    """
+    index = await test_client.create_index(uid=READ_ONLY_INDEX_UID)
+    yield index
+    response = await index.delete()
+    await wait_for_task(test_client.http_client, response.task_uid)
+
+
 @pytest.fixture
 async def empty_index(test_client):
     async def index_maker(index_name=INDEX_UID):
@@ -6,8 +6,10 @@ from typing import Any
 
 import jwt
 import pytest
+import respx
 from httpx import AsyncClient, ConnectError, ConnectTimeout, RemoteProtocolError, Request, Response
 
+from meilisearch_python_async._http_requests import HttpRequests
 from meilisearch_python_async.client import Client
 from meilisearch_python_async.errors import (
     InvalidRestriction,
@@ -19,6 +21,8 @@ from meilisearch_python_async.models.index import IndexInfo
 from meilisearch_python_async.models.version import Version
 from meilisearch_python_async.task import get_task, wait_for_task
 
+_API_ERROR_404 = MeiliSearchApiError("test", Response(status_code=404))
+
 
 @pytest.fixture
 async def remove_default_search_key(default_search_key, test_client):
@@ -153,12 +157,34 @@ async def test_get_indexes(test_client, index_uid, index_uid2):
     assert len(response) == 2
 
 
+@pytest.mark.usefixtures("indexes_sample")
+async def test_get_indexes_stream(test_client, index_uid, index_uid2):
+    response_uids = [index.uid async for index in test_client.get_indexes_stream()]
+
+    assert index_uid in response_uids
+    assert index_uid2 in response_uids
+    assert len(response_uids) == 2
+
+
+async def test_get_indexes_stream_none(test_client):
+    response_uids = [index.uid async for index in test_client.get_indexes_stream()]
+
+    assert response_uids == []
+
+
 async def test_get_indexes_none(test_client):
     response = await test_client.get_indexes()
 
     assert response is None
 
 
+@pytest.mark.usefixtures("indexes_sample")
+async def test_get_indexes_by_uids(test_client, index_uid, index_uid2):
+    response = await test_client.get_indexes_by_uids([index_uid, index_uid2])
+
+    assert [x.uid for x in response] == [index_uid, index_uid2]
+
+
 @pytest.mark.usefixtures("indexes_sample")
 async def test_get_index(test_client, index_uid):
     response = await test_client.get_index(index_uid)
@@ -174,6 +200,15 @@ async def test_get_index_not_found(test_client):
         await test_client.get_index("test")
 
 
+async def test_get_index_no_fetch(test_client):
+    index = await test_client.get_index("test", fetch=False)
+
+    assert index.uid == "test"
+    assert index.primary_key is None
+    assert index.created_at is None
+    assert index.updated_at is None
+
+
 def test_index(test_client):
     uid = "test"
     response = test_client.index(uid)
@@ -181,6 +216,14 @@ def test_index(test_client):
     assert response.uid == uid
 
 
+async def test_gather(test_client):
+    results = await test_client.gather(
+        *(test_client.create_index(f"gather-{i}") for i in range(3)), max_concurrency=2
+    )
+
+    assert [x.uid for x in results] == ["gather-0", "gather-1", "gather-2"]
+
+
 async def test_get_or_create_index_with_primary_key(test_client):
     primary_key = "pk_test"
     uid = "test1"
@@ -213,13 +256,22 @@ async def test_get_or_create_index_communication_error(test_client, monkeypatch)
 
 async def test_get_or_create_index_api_error(test_client, monkeypatch):
     async def mock_response(*args, **kwargs):
-        raise MeiliSearchApiError("test", Response(status_code=404))
+        raise _API_ERROR_404
 
     monkeypatch.setattr(Client, "get_index", mock_response)
     with pytest.raises(MeiliSearchApiError):
         await test_client.get_or_create_index("test")
 
 
+@pytest.mark.usefixtures("indexes_sample")
+async def test_delete_indexes_if_exist(test_client, index_uid, index_uid2):
+    result = await test_client.delete_indexes_if_exist([index_uid, index_uid2, "none"])
+
+    assert result[index_uid] is True
+    assert result[index_uid2] is True
+    assert result["none"] is False
+
+
 @pytest.mark.usefixtures("indexes_sample")
 async def test_get_all_stats(test_client, index_uid, index_uid2):
     response = await test_client.get_all_stats()
@@ -252,6 +304,31 @@ async def test_get_raw_indexes(test_client, index_uid, index_uid2):
     assert len(response) == 2
 
 
+@pytest.mark.usefixtures("indexes_sample")
+async def test_get_raw_indexes_cache(test_client, monkeypatch):
+    expected = await test_client.get_raw_indexes(cache=True)
+
+    async def mock_get(*args, **kwargs):
+        raise AssertionError("Cached value should be used instead of a request")
+
+    monkeypatch.setattr(HttpRequests, "get", mock_get)
+    response = await test_client.get_raw_indexes(cache=True)
+
+    assert response == expected
+    test_client.invalidate_cache()
+
+
+@pytest.mark.usefixtures("indexes_sample")
+async def test_get_raw_indexes_fast(test_client, index_uid, index_uid2):
+    pytest.importorskip("msgspec")
+    response = await test_client.get_raw_indexes(fast=True)
+    response_uids = [x.uid for x in response]
+
+    assert index_uid in response_uids
+    assert index_uid2 in response_uids
+    assert len(response) == 2
+
+
 async def test_get_raw_indexes_none(test_client):
     response = await test_client.get_raw_indexes()
 
@@ -264,6 +341,19 @@ async def test_health(test_client):
     assert health.status == "available"
 
 
+async def test_health_ttl(base_url, master_key, monkeypatch):
+    async with Client(base_url, master_key, health_ttl=60) as client:
+        expected = await client.health()
+
+        async def mock_get(*args, **kwargs):
+            raise AssertionError("Cached value should be used instead of a request")
+
+        monkeypatch.setattr(HttpRequests, "get", mock_get)
+        health = await client.health()
+
+    assert health.status == expected.status
+
+
 async def test_create_key(test_key_info, test_client):
     expires_at = datetime.utcnow() + timedelta(days=2)
     test_key_info.expires_at = expires_at
@@ -322,6 +412,19 @@ async def test_get_version(test_client):
     assert isinstance(response, Version)
 
 
+async def test_get_version_cache(test_client, monkeypatch):
+    expected = await test_client.get_version()
+
+    async def mock_get(*args, **kwargs):
+        raise AssertionError("Cached value should be used instead of a request")
+
+    monkeypatch.setattr(HttpRequests, "get", mock_get)
+    response = await test_client.get_version()
+
+    assert response == expected
+    test_client.invalidate_cache()
+
+
 async def test_create_dump(test_client, index_with_documents):
     index = await index_with_documents("indexUID-dump-creation")
 
@@ -334,6 +437,36 @@ async def test_create_dump(test_client, index_with_documents):
     assert dump_status.task_type == "dumpCreation"
 
 
+@respx.mock
+async def test_warm_on_enter(base_url):
+    health_route = respx.get(f"{base_url}/health").mock(
+        return_value=Response(200, json={"status": "available"})
+    )
+
+    async with Client(base_url):
+        pass
+
+    assert health_route.called
+
+
+async def test_no_warm_on_enter(base_url):
+    async with Client(base_url, warm=False):
+        pass
+
+
+async def test_shared_client(base_url, master_key):
+    client = Client.shared(base_url, master_key)
+
+    assert Client.shared(base_url, master_key) is client
+
+    await client.aclose()
+    new_client = Client.shared(base_url, master_key)
+
+    assert new_client is not client
+
+    await new_client.aclose()
+
+
 async def test_no_master_key(base_url):
     with pytest.raises(MeiliSearchApiError):
         async with Client(base_url) as client:
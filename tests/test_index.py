@@ -1,9 +1,11 @@
+import asyncio
+import re
 from datetime import datetime
 
 import pytest
+import respx
 from httpx import Response
 
-from meilisearch_python_async._http_requests import HttpRequests
 from meilisearch_python_async.errors import MeiliSearchApiError
 from meilisearch_python_async.index import Index
 from meilisearch_python_async.models.settings import (
@@ -14,7 +16,7 @@ from meilisearch_python_async.models.settings import (
 from meilisearch_python_async.task import wait_for_task
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def new_settings():
     return MeiliSearchSettings(
         ranking_rules=["typo", "words"],
@@ -24,67 +26,68 @@ def new_settings():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_ranking_rules():
     return ["words", "typo", "proximity", "attribute", "sort", "exactness"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def new_ranking_rules():
     return ["typo", "exactness"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def new_distinct_attribute():
     return "title"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_distinct_attribute():
     return None
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def new_searchable_attributes():
     return ["something", "random"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def displayed_attributes():
     return ["id", "release_date", "title", "poster", "overview", "genre"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def new_stop_words():
     return ["of", "the"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def new_synonyms():
     return {"hp": ["harry potter"]}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def filterable_attributes():
     return ["release_date", "title"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sortable_attributes():
     return ["genre", "title"]
 
 
 @pytest.mark.usefixtures("indexes_sample")
 async def test_delete_index(test_client, index_uid, index_uid2):
-    response = await test_client.index(uid=index_uid).delete()
-    await wait_for_task(test_client.http_client, response.task_uid)
+    responses = await asyncio.gather(
+        test_client.index(uid=index_uid).delete(), test_client.index(uid=index_uid2).delete()
+    )
+    await asyncio.gather(
+        *(wait_for_task(test_client.http_client, response.task_uid) for response in responses)
+    )
 
     with pytest.raises(MeiliSearchApiError):
         await test_client.get_index(uid=index_uid)
 
-    response = await test_client.index(uid=index_uid2).delete()
-    await wait_for_task(test_client.http_client, response.task_uid)
-
     with pytest.raises(MeiliSearchApiError):
         await test_client.get_index(uid=index_uid2)
 
@@ -110,15 +113,15 @@ async def test_get_stats(empty_index, small_movies):
     assert response.number_of_documents == 30
 
 
-async def test_get_settings_default(empty_index, default_ranking_rules):
-    index = await empty_index()
-    response = await index.get_settings()
+async def test_get_settings_default(shared_empty_index, default_ranking_rules):
+    response = await shared_empty_index.get_settings()
     assert response.ranking_rules == default_ranking_rules
     assert response.distinct_attribute is None
     assert response.searchable_attributes == ["*"]
     assert response.displayed_attributes == ["*"]
     assert response.stop_words == []
     assert response.synonyms == {}
+    assert response.filterable_attributes == []
     assert response.sortable_attributes == []
     assert response.typo_tolerance.enabled is True
 
@@ -167,10 +170,58 @@ async def test_reset_settings(empty_index, new_settings, default_ranking_rules):
     assert response.typo_tolerance.enabled is True
 
 
-async def test_get_ranking_rules_default(empty_index, default_ranking_rules):
+async def test_update_all_settings_batched(
+    empty_index,
+    new_ranking_rules,
+    new_distinct_attribute,
+    new_searchable_attributes,
+    displayed_attributes,
+    new_stop_words,
+    new_synonyms,
+    filterable_attributes,
+    sortable_attributes,
+):
+    all_settings = MeiliSearchSettings(
+        ranking_rules=new_ranking_rules,
+        distinct_attribute=new_distinct_attribute,
+        searchable_attributes=new_searchable_attributes,
+        displayed_attributes=displayed_attributes,
+        stop_words=new_stop_words,
+        synonyms=new_synonyms,
+        filterable_attributes=filterable_attributes,
+        sortable_attributes=sortable_attributes,
+        typo_tolerance=TypoTolerance(enabled=False),
+    )
     index = await empty_index()
-    response = await index.get_ranking_rules()
-    assert response == default_ranking_rules
+    response = await index.update_settings(all_settings)
+    update = await wait_for_task(index.http_client, response.task_uid)
+    assert update.status == "succeeded"
+    response = await index.get_settings()
+    assert response.ranking_rules == new_ranking_rules
+    assert response.distinct_attribute == new_distinct_attribute
+    assert response.searchable_attributes == new_searchable_attributes
+    assert response.displayed_attributes == displayed_attributes
+    assert response.stop_words == new_stop_words
+    assert response.synonyms == new_synonyms
+    assert set(response.filterable_attributes) == set(filterable_attributes)
+    assert response.sortable_attributes == sortable_attributes
+    assert response.typo_tolerance.enabled is False
+
+
+@pytest.mark.parametrize(
+    "getter, expected",
+    [
+        ("get_ranking_rules", ["words", "typo", "proximity", "attribute", "sort", "exactness"]),
+        ("get_distinct_attribute", None),
+        ("get_stop_words", None),
+        ("get_synonyms", None),
+        ("get_filterable_attributes", None),
+        ("get_sortable_attributes", []),
+    ],
+)
+async def test_get_default(shared_empty_index, getter, expected):
+    response = await getattr(shared_empty_index, getter)()
+    assert response == expected
 
 
 async def test_update_ranking_rules(empty_index, new_ranking_rules):
@@ -194,12 +245,6 @@ async def test_reset_ranking_rules(empty_index, new_ranking_rules, default_ranki
     assert response == default_ranking_rules
 
 
-async def test_get_distinct_attribute(empty_index, default_distinct_attribute):
-    index = await empty_index()
-    response = await index.get_distinct_attribute()
-    assert response == default_distinct_attribute
-
-
 async def test_update_distinct_attribute(empty_index, new_distinct_attribute):
     index = await empty_index()
     response = await index.update_distinct_attribute(new_distinct_attribute)
@@ -285,12 +330,6 @@ async def test_reset_displayed_attributes(empty_index, displayed_attributes):
     assert response == ["*"]
 
 
-async def test_get_stop_words_default(empty_index):
-    index = await empty_index()
-    response = await index.get_stop_words()
-    assert response is None
-
-
 async def test_update_stop_words(empty_index, new_stop_words):
     index = await empty_index()
     response = await index.update_stop_words(new_stop_words)
@@ -314,12 +353,6 @@ async def test_reset_stop_words(empty_index, new_stop_words):
     assert response is None
 
 
-async def test_get_synonyms_default(empty_index):
-    index = await empty_index()
-    response = await index.get_synonyms()
-    assert response is None
-
-
 async def test_update_synonyms(empty_index, new_synonyms):
     index = await empty_index()
     response = await index.update_synonyms(new_synonyms)
@@ -343,18 +376,12 @@ async def test_reset_synonyms(empty_index, new_synonyms):
     assert response is None
 
 
-async def test_get_filterable_attributes(empty_index):
-    index = await empty_index()
-    response = await index.get_filterable_attributes()
-    assert response is None
-
-
 async def test_update_filterable_attributes(empty_index, filterable_attributes):
     index = await empty_index()
     response = await index.update_filterable_attributes(filterable_attributes)
     await wait_for_task(index.http_client, response.task_uid)
     response = await index.get_filterable_attributes()
-    assert sorted(response) == filterable_attributes
+    assert set(response) == set(filterable_attributes)
 
 
 async def test_reset_filterable_attributes(empty_index, filterable_attributes):
@@ -363,25 +390,19 @@ async def test_reset_filterable_attributes(empty_index, filterable_attributes):
     update = await wait_for_task(index.http_client, response.task_uid)
     assert update.status == "succeeded"
     response = await index.get_filterable_attributes()
-    assert sorted(response) == filterable_attributes
+    assert set(response) == set(filterable_attributes)
     response = await index.reset_filterable_attributes()
     await wait_for_task(index.http_client, response.task_uid)
     response = await index.get_filterable_attributes()
     assert response is None
 
 
-async def test_get_sortable_attributes(empty_index):
-    index = await empty_index()
-    response = await index.get_sortable_attributes()
-    assert response == []
-
-
 async def test_update_sortable_attributes(empty_index, sortable_attributes):
     index = await empty_index()
     response = await index.update_sortable_attributes(sortable_attributes)
     await wait_for_task(index.http_client, response.task_uid)
     response = await index.get_sortable_attributes()
-    assert sorted(response) == sortable_attributes
+    assert set(response) == set(sortable_attributes)
 
 
 async def test_reset_sortable_attributes(empty_index, sortable_attributes):
@@ -390,16 +411,15 @@ async def test_reset_sortable_attributes(empty_index, sortable_attributes):
     update = await wait_for_task(index.http_client, response.task_uid)
     assert update.status == "succeeded"
     response = await index.get_sortable_attributes()
-    assert response == sortable_attributes
+    assert set(response) == set(sortable_attributes)
     response = await index.reset_sortable_attributes()
     await wait_for_task(index.http_client, response.task_uid)
     response = await index.get_sortable_attributes()
     assert response == []
 
 
-async def test_get_typo_tolerance(empty_index):
-    index = await empty_index()
-    response = await index.get_typo_tolerance()
+async def test_get_typo_tolerance(shared_empty_index):
+    response = await shared_empty_index.get_typo_tolerance()
     assert response.enabled is True
 
 
@@ -414,7 +434,7 @@ async def test_update_typo_tolerance(empty_index):
     response = await index.update_typo_tolerance(typo_tolerance)
     await wait_for_task(index.http_client, response.task_uid)
     response = await index.get_typo_tolerance()
-    assert response.dict() == typo_tolerance.dict()
+    assert response == typo_tolerance
 
 
 async def test_reset_typo_tolerance(empty_index):
@@ -442,24 +462,16 @@ def test_iso_to_date_time(iso_date, expected, test_client):
     assert converted == expected
 
 
-async def test_str(empty_index):
-    index = await empty_index()
-    got = index.__str__()
+async def test_str(shared_empty_index):
+    got = shared_empty_index.__str__()
 
-    assert "uid" in got
-    assert "primary_key" in got
-    assert "created_at" in got
-    assert "updated_at" in got
+    assert {"uid", "primary_key", "created_at", "updated_at"} <= set(re.findall(r"\w+", got))
 
 
-async def test_repr(empty_index):
-    index = await empty_index()
-    got = index.__repr__()
+async def test_repr(shared_empty_index):
+    got = shared_empty_index.__repr__()
 
-    assert "uid" in got
-    assert "primary_key" in got
-    assert "created_at" in got
-    assert "updated_at" in got
+    assert {"uid", "primary_key", "created_at", "updated_at"} <= set(re.findall(r"\w+", got))
 
 
 @pytest.mark.usefixtures("indexes_sample")
@@ -480,11 +492,9 @@ async def test_delete_if_exists_no_delete(test_client):
 
 
 @pytest.mark.usefixtures("indexes_sample")
-async def test_delete_if_exists_error(test_client, index_uid, monkeypatch):
-    async def mock_response(*args, **kwargs):
-        raise MeiliSearchApiError("test", Response(status_code=404))
-
-    monkeypatch.setattr(HttpRequests, "_send_request", mock_response)
+@respx.mock
+async def test_delete_if_exists_error(test_client, index_uid):
+    respx.delete(url__regex=r".*/indexes/.*").mock(return_value=Response(status_code=404))
     with pytest.raises(MeiliSearchApiError):
         await test_client.index(index_uid).delete_if_exists()
 
@@ -507,10 +517,8 @@ async def test_delete_index_if_exists_no_delete(test_client):
 
 
 @pytest.mark.usefixtures("indexes_sample")
-async def test_delete_index_if_exists_error(test_client, index_uid, monkeypatch):
-    async def mock_response(*args, **kwargs):
-        raise MeiliSearchApiError("test", Response(status_code=404))
-
-    monkeypatch.setattr(HttpRequests, "_send_request", mock_response)
+@respx.mock
+async def test_delete_index_if_exists_error(test_client, index_uid):
+    respx.delete(url__regex=r".*/indexes/.*").mock(return_value=Response(status_code=404))
     with pytest.raises(MeiliSearchApiError):
         await test_client.delete_index_if_exists(index_uid)